@@ -117,6 +117,11 @@ class FeatureType(Enum):
         return dict
 
 
+# Values of feature types mapped to feature types. It is faster than calling FeatureType(value) or iterating over
+# FeatureType, therefore it is used in frequently called code.
+FEATURE_TYPE_VALUES = {feature_type.value: feature_type for feature_type in FeatureType}
+
+
 class FeatureTypeSet:
     """ A collection of immutable sets of feature types, grouped together by certain properties.
     """
@@ -149,12 +154,18 @@ class FileFormat(Enum):
     PICKLE = 'pkl'
     NPY = 'npy'
     GZIP = 'gz'
+    ZSTD = 'zst'
 
     def extension(self):
         """ Returns file extension of file format
         """
         return '.{}'.format(self.value)
 
+    def is_compression(self):
+        """ True if file format is a compression format and False otherwise
+        """
+        return self in (FileFormat.GZIP, FileFormat.ZSTD)
+
     @staticmethod
     def split_by_extensions(filename):
         """ Splits the filename string by the extension of the file
@@ -104,6 +104,9 @@ class SaveTask(IOTask):
         :param compress_level: A level of data compression and can be specified with an integer from 0 (no compression)
             to 9 (highest compression).
         :type compress_level: int
+        :param compress_format: A format used for compression, either `FileFormat.GZIP` (default) or
+            `FileFormat.ZSTD`. The latter requires an optional package `zstandard`.
+        :type compress_format: FileFormat or str
         :param config: A configuration object with AWS credentials. By default is set to None and in this case the
             default configuration will be taken.
         :type config: SHConfig or None
@@ -149,6 +152,9 @@ class LoadTask(IOTask):
         :type features: an object supported by the :class:`FeatureParser<eolearn.core.utilities.FeatureParser>`
         :param lazy_loading: If `True` features will be lazy loaded. Default is `False`
         :type lazy_loading: bool
+        :param mmap: If `True` uncompressed raster features from a local filesystem will be loaded as read-only
+            memory-mapped arrays. Default is `False`
+        :type mmap: bool
         :param config: A configuration object with AWS credentials. By default is set to None and in this case the
             default configuration will be taken.
         :type config: SHConfig or None
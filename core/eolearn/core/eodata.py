@@ -21,7 +21,7 @@ import geopandas as gpd
 
 from sentinelhub import BBox, CRS
 
-from .constants import FeatureType, OverwritePermission
+from .constants import FeatureType, FileFormat, OverwritePermission, FEATURE_TYPE_VALUES
 from .eodata_io import save_eopatch, load_eopatch, FeatureIO
 from .eodata_merge import merge_eopatches
 from .fs_utils import get_filesystem
@@ -73,12 +73,13 @@ class EOPatch:
 
         In case they are a dictionary they are cast to _FeatureDict class
         """
-        if feature_name not in (None, Ellipsis) and FeatureType.has_value(key):
-            self[key][feature_name] = value
+        feature_type = FEATURE_TYPE_VALUES.get(key)
+
+        if feature_name not in (None, Ellipsis) and feature_type is not None:
+            self[feature_type][feature_name] = value
             return
 
-        if FeatureType.has_value(key) and not isinstance(value, FeatureIO):
-            feature_type = FeatureType(key)
+        if feature_type is not None and not isinstance(value, FeatureIO):
             value = self._parse_feature_type_value(feature_type, value)
 
         super().__setattr__(key, value)
@@ -91,7 +92,9 @@ class EOPatch:
         :raises: TypeError, ValueError
         """
         if feature_type.has_dict() and isinstance(value, dict):
-            return value if isinstance(value, _FeatureDict) else _FeatureDict(value, feature_type)
+            if isinstance(value, _FeatureDict) and value.feature_type is feature_type:
+                return value
+            return _FeatureDict(value, feature_type)
 
         if feature_type is FeatureType.BBOX:
             if value is None or isinstance(value, BBox):
@@ -134,7 +137,7 @@ class EOPatch:
             self._check_tuple_key(feature_type)
             feature_type, feature_name = feature_type
 
-        return self.__getattribute__(FeatureType(feature_type).value, feature_name=feature_name)
+        return self.__getattribute__(_parse_feature_type(feature_type).value, feature_name=feature_name)
 
     def __setitem__(self, feature_type, value):
         """Sets a new dictionary / list to the given FeatureType. As a key it can also accept a tuple of
@@ -151,7 +154,7 @@ class EOPatch:
             self._check_tuple_key(feature_type)
             feature_type, feature_name = feature_type
 
-        return self.__setattr__(FeatureType(feature_type).value, value, feature_name=feature_name)
+        return self.__setattr__(_parse_feature_type(feature_type).value, value, feature_name=feature_name)
 
     @staticmethod
     def _check_tuple_key(key):
@@ -261,9 +264,15 @@ class EOPatch:
         if not features:  # For some reason deepcopy and copy pass {} by default
             features = ...
 
-        new_eopatch = self.__copy__(features=features)
-        for feature_type in FeatureType:
-            new_eopatch[feature_type] = copy.deepcopy(new_eopatch[feature_type], memo)
+        # A single memo is shared among all features so that objects referenced by multiple features are copied once
+        memo = {} if memo is None else memo
+
+        new_eopatch = EOPatch()
+        for feature_type, feature_name in FeatureParser(features)(self):
+            if feature_name is ...:
+                new_eopatch[feature_type] = copy.deepcopy(self[feature_type], memo)
+            else:
+                new_eopatch[feature_type][feature_name] = copy.deepcopy(self[feature_type][feature_name], memo)
 
         return new_eopatch
 
@@ -326,7 +335,7 @@ class EOPatch:
         :type feature_type: FeatureType
         :raise: TypeError
         """
-        feature_type = FeatureType(feature_type)
+        feature_type = _parse_feature_type(feature_type)
         if feature_type.type() is not dict:
             raise TypeError('{} does not contain a dictionary of features'.format(feature_type))
 
@@ -336,7 +345,7 @@ class EOPatch:
         :param feature_type: Type of a feature
         :type feature_type: FeatureType
         """
-        feature_type = FeatureType(feature_type)
+        feature_type = _parse_feature_type(feature_type)
         if feature_type.has_dict():
             self[feature_type] = {}
         elif feature_type is FeatureType.BBOX:
@@ -451,11 +460,20 @@ class EOPatch:
 
         for feature_type in FeatureType:
             if feature_type.has_dict():
-                eopatch_content[feature_type.value] = {**eopatch1[feature_type], **eopatch2[feature_type]}
+                features1, features2 = eopatch1[feature_type], eopatch2[feature_type]
+
+                # Shallow copies of _FeatureDict objects are passed on to the new EOPatch, which prevents checking all
+                # features again
+                if not features1 or not features2:
+                    eopatch_content[feature_type.value] = copy.copy(features1 or features2)
+                    continue
+
+                eopatch_content[feature_type.value] = copy.copy(features1)
+                eopatch_content[feature_type.value].update(features2)
 
-                for feature_name in eopatch1[feature_type].keys() & eopatch2[feature_type].keys():
-                    data1 = eopatch1[feature_type][feature_name]
-                    data2 = eopatch2[feature_type][feature_name]
+                for feature_name in features1.keys() & features2.keys():
+                    data1 = features1[feature_name]
+                    data2 = features2[feature_name]
 
                     if feature_type.is_time_dependent() and not timestamps_match:
                         eopatch_content[feature_type.value][feature_name] = EOPatch.concatenate_data(data1, data2)
@@ -491,7 +509,7 @@ class EOPatch:
         return np.concatenate((data1, data2), axis=0)
 
     def save(self, path, features=..., overwrite_permission=OverwritePermission.ADD_ONLY, compress_level=0,
-             filesystem=None):
+             compress_format=FileFormat.GZIP, filesystem=None):
         """ Method to save an EOPatch from memory to a storage
 
         :param path: A location where to save EOPatch. It can be either a local path or a remote URL path.
@@ -504,6 +522,10 @@ class EOPatch:
         :param compress_level: A level of data compression and can be specified with an integer from 0 (no compression)
             to 9 (highest compression).
         :type compress_level: int
+        :param compress_format: A format used for compression, either `FileFormat.GZIP` (default) or
+            `FileFormat.ZSTD`. The latter is much faster but requires an optional package `zstandard`. It is only used
+            if `compress_level` is larger than 0.
+        :type compress_format: FileFormat or str
         :param filesystem: An existing filesystem object. If not given it will be initialized according to the `path`
             parameter.
         :type filesystem: fs.FS or None
@@ -513,10 +535,11 @@ class EOPatch:
             path = '/'
 
         save_eopatch(self, filesystem, path, features=features, compress_level=compress_level,
+                     compress_format=FileFormat(compress_format),
                      overwrite_permission=OverwritePermission(overwrite_permission))
 
     @staticmethod
-    def load(path, features=..., lazy_loading=False, filesystem=None):
+    def load(path, features=..., lazy_loading=False, mmap=False, filesystem=None):
         """ Method to load an EOPatch from a storage into memory
 
         :param path: A location from where to load EOPatch. It can be either a local path or a remote URL path.
@@ -525,6 +548,9 @@ class EOPatch:
         :type features: object
         :param lazy_loading: If `True` features will be lazy loaded.
         :type lazy_loading: bool
+        :param mmap: If `True` uncompressed raster features from a local filesystem will be loaded as read-only
+            memory-mapped arrays. Their data will be read from disk only once it is accessed.
+        :type mmap: bool
         :param filesystem: An existing filesystem object. If not given it will be initialized according to the `path`
             parameter.
         :type filesystem: fs.FS or None
@@ -535,7 +561,7 @@ class EOPatch:
             filesystem = get_filesystem(path, create=False)
             path = '/'
 
-        return load_eopatch(EOPatch(), filesystem, path, features=features, lazy_loading=lazy_loading)
+        return load_eopatch(EOPatch(), filesystem, path, features=features, lazy_loading=lazy_loading, mmap=mmap)
 
     def merge(self, *eopatches, features=..., time_dependent_op=None, timeless_op=None):
         """ Merge features of given EOPatches into a new EOPatch
@@ -594,8 +620,15 @@ class EOPatch:
         if ref_date is None:
             ref_date = self.timestamp[0]
 
-        return np.asarray([round((timestamp - ref_date).total_seconds() / scale_time) for timestamp in self.timestamp],
-                          dtype=np.int64)
+        # Parsing timezone aware datetimes into numpy.datetime64 is deprecated, therefore such time differences are
+        # computed with Python objects
+        if any(getattr(date, 'tzinfo', None) is not None for date in self.timestamp + [ref_date]):
+            seconds = np.array([(timestamp - ref_date).total_seconds() for timestamp in self.timestamp])
+        else:
+            time_deltas = np.array(self.timestamp, dtype='datetime64[us]') - np.datetime64(ref_date, 'us')
+            seconds = time_deltas / np.timedelta64(1, 's')
+
+        return np.round(seconds / scale_time).astype(np.int64)
 
     def consolidate_timestamps(self, timestamps):
         """Removes all frames from the EOPatch with a date not found in the provided timestamps list.
@@ -606,9 +639,12 @@ class EOPatch:
         :rtype: set of datetime objects
         """
         remove_from_patch = set(self.timestamp).difference(timestamps)
-        remove_from_patch_idxs = [self.timestamp.index(rm_date) for rm_date in remove_from_patch]
-        good_timestamp_idxs = [idx for idx, _ in enumerate(self.timestamp) if idx not in remove_from_patch_idxs]
-        good_timestamps = [date for idx, date in enumerate(self.timestamp) if idx not in remove_from_patch_idxs]
+        if not remove_from_patch:
+            return remove_from_patch
+
+        timestamp = self.timestamp
+        good_timestamp_idxs = [idx for idx, date in enumerate(timestamp) if date not in remove_from_patch]
+        good_timestamps = [timestamp[idx] for idx in good_timestamp_idxs]
 
         for feature_type in [feature_type for feature_type in FeatureType if (feature_type.is_time_dependent() and
                                                                               feature_type.has_dict())]:
@@ -658,6 +694,15 @@ class EOPatch:
         return vis.plot()
 
 
+def _parse_feature_type(feature_type):
+    """ Equivalent to `FeatureType(feature_type)`, but much faster in the most common case when the given object is
+    already a feature type
+    """
+    if isinstance(feature_type, FeatureType):
+        return feature_type
+    return FeatureType(feature_type)
+
+
 class _FeatureDict(dict):
     """A dictionary structure that holds features of certain feature type.
 
@@ -679,8 +724,14 @@ class _FeatureDict(dict):
         self.ndim = self.feature_type.ndim()
         self.is_vector = self.feature_type.is_vector()
 
-        for feature_name, value in feature_dict.items():
-            self[feature_name] = value
+        # Features are validated all at once and then added without going through __setitem__ for each of them
+        if self.ndim or self.is_vector:
+            feature_dict = {feature_name: self._parse_feature_value(value)
+                            for feature_name, value in feature_dict.items()}
+        for feature_name in feature_dict:
+            self._check_feature_name(feature_name)
+
+        dict.update(self, feature_dict)
 
     def __setitem__(self, feature_name, value):
         """ Before setting value to the dictionary it checks that value is of correct type and dimension and tries to
@@ -695,14 +746,23 @@ class _FeatureDict(dict):
             error_msg = "Feature name must be a string but an object of type {} was given."
             raise ValueError(error_msg.format(type(feature_name)))
 
-        for char in feature_name:
-            if char in self.FORBIDDEN_CHARS:
-                error_msg = "The name of feature ({}, {}) contains an illegal character '{}'."
-                raise ValueError(error_msg.format(self.feature_type, feature_name, char))
+        if not self.FORBIDDEN_CHARS.isdisjoint(feature_name):
+            char = next(char for char in feature_name if char in self.FORBIDDEN_CHARS)
+            error_msg = "The name of feature ({}, {}) contains an illegal character '{}'."
+            raise ValueError(error_msg.format(self.feature_type, feature_name, char))
 
         if feature_name == '':
             raise ValueError("Feature name cannot be an empty string.")
 
+    def __copy__(self):
+        """ Makes a shallow copy of the dictionary. Features are not checked again because they have already been
+        checked when they were added.
+        """
+        new_feature_dict = self.__class__.__new__(self.__class__)
+        new_feature_dict.__dict__.update(self.__dict__)
+        dict.update(new_feature_dict, self)
+        return new_feature_dict
+
     def __getitem__(self, feature_name, load=True):
         """Implements lazy loading."""
         value = super().__getitem__(feature_name)
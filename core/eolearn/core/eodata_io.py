@@ -19,14 +19,29 @@ import numpy as np
 from geopandas import GeoDataFrame, GeoSeries
 from sentinelhub.os_utils import sys_is_windows
 
-from .constants import FeatureType, FileFormat, OverwritePermission
+from .constants import FileFormat, OverwritePermission, FEATURE_TYPE_VALUES
 from .utilities import FeatureParser
 
+try:
+    # If installed, a gzip implementation from Intel's ISA-L is used for loading local files, because it decompresses
+    # about twice as fast. It isn't used for saving because it only supports compression levels up to 3.
+    from isal import igzip
+except ImportError:
+    igzip = None
+
+# Protocol 4 is the highest protocol that all supported Python versions (3.6+) can read, therefore saved EOPatches
+# remain portable between them
+PICKLE_PROTOCOL = 4
+
 
 def save_eopatch(eopatch, filesystem, patch_location, features=..., overwrite_permission=OverwritePermission.ADD_ONLY,
-                 compress_level=0):
+                 compress_level=0, compress_format=FileFormat.GZIP):
     """ A utility function used by EOPatch.save method
     """
+    if not compress_format.is_compression():
+        raise ValueError('Parameter compress_format should be one of {}, but {} '
+                         'found'.format([FileFormat.GZIP, FileFormat.ZSTD], compress_format))
+
     patch_exists = filesystem.exists(patch_location)
 
     if overwrite_permission is OverwritePermission.OVERWRITE_PATCH and patch_exists:
@@ -56,20 +71,28 @@ def save_eopatch(eopatch, filesystem, patch_location, features=..., overwrite_pe
             filesystem.makedirs(folder, recreate=True)
 
     features_to_save = ((FeatureIO(filesystem, path),
-                         eopatch[(ftype, fname)],
+                         (ftype, fname),
                          FileFormat.NPY if ftype.is_raster() else FileFormat.PICKLE,
-                         compress_level) for ftype, fname, path in eopatch_features)
+                         compress_level,
+                         compress_format) for ftype, fname, path in eopatch_features)
 
     with concurrent.futures.ThreadPoolExecutor() as executor:
         # The following is intentionally wrapped in a list in order to get back potential exceptions
-        list(executor.map(lambda params: params[0].save(*params[1:]), features_to_save))
+        list(executor.map(lambda params: _save_single_feature(eopatch, *params), features_to_save))
+
+
+def _save_single_feature(eopatch, feature_io, feature, file_format, compress_level, compress_format):
+    """ Obtains a feature from an EOPatch and saves it. Values of lazily loaded features are therefore also loaded
+    in the worker thread and not by the thread that schedules the saving
+    """
+    feature_io.save(eopatch[feature], file_format, compress_level, compress_format)
 
 
-def load_eopatch(eopatch, filesystem, patch_location, features=..., lazy_loading=False):
+def load_eopatch(eopatch, filesystem, patch_location, features=..., lazy_loading=False, mmap=False):
     """ A utility function used by EOPatch.load method
     """
     features = list(walk_filesystem(filesystem, patch_location, features))
-    loading_data = [FeatureIO(filesystem, path) for _, _, path in features]
+    loading_data = [FeatureIO(filesystem, path, mmap=mmap) for _, _, path in features]
 
     if not lazy_loading:
         with concurrent.futures.ThreadPoolExecutor() as executor:
@@ -130,8 +153,9 @@ def walk_main_folder(filesystem, folder_path):
         else:
             ftype_str, fname = raw_path, ...
 
-        if FeatureType.has_value(ftype_str):
-            yield FeatureType(ftype_str), fname, fs.path.combine(folder_path, path)
+        ftype = FEATURE_TYPE_VALUES.get(ftype_str)
+        if ftype is not None:
+            yield ftype, fname, fs.path.combine(folder_path, path)
 
 
 def walk_feature_type_folder(filesystem, folder_path):
@@ -146,9 +170,13 @@ def walk_eopatch(eopatch, patch_location, features=...):
     """ Recursively reads a patch_location and returns yields tuples of (feature_type, feature_name, file_path)
     """
     returned_meta_features = set()
+    ftype_folders = {}
     for ftype, fname in FeatureParser(features)(eopatch):
-        name_basis = fs.path.combine(patch_location, ftype.value)
-        if ftype.is_meta():
+        if ftype not in ftype_folders:
+            ftype_folders[ftype] = fs.path.combine(patch_location, ftype.value), ftype.is_meta()
+        name_basis, is_meta = ftype_folders[ftype]
+
+        if is_meta:
             if eopatch[ftype] and ftype not in returned_meta_features:
                 yield ftype, ..., name_basis
                 returned_meta_features.add(ftype)
@@ -193,15 +221,19 @@ def _to_lowercase(ftype, fname, *_):
 class FeatureIO:
     """ A class handling saving and loading process of a single feature at a given location
     """
-    def __init__(self, filesystem, path):
+    def __init__(self, filesystem, path, mmap=False):
         """
         :param filesystem: A filesystem object
         :type filesystem: fs.FS
         :param path: A path in the filesystem
         :type path: str
+        :param mmap: If `True` an uncompressed numpy array stored in a local filesystem will be loaded as a read-only
+            memory-mapped array.
+        :type mmap: bool
         """
         self.filesystem = filesystem
         self.path = path
+        self.mmap = mmap
 
     def __repr__(self):
         """ A representation method
@@ -211,27 +243,37 @@ class FeatureIO:
     def load(self):
         """ Method for loading a feature
         """
+        if self.mmap and self.path.endswith(FileFormat.NPY.extension()) and self.filesystem.hassyspath(self.path):
+            return np.load(self.filesystem.getsyspath(self.path), mmap_mode='r')
+
         with self.filesystem.openbin(self.path, 'r') as file_handle:
             if self.path.endswith(FileFormat.GZIP.extension()):
-                with gzip.open(file_handle, 'rb') as gzip_fp:
+                # File objects of some remote filesystems don't support readinto, which is required by igzip
+                gzip_module = igzip if igzip and self.filesystem.hassyspath(self.path) else gzip
+                with gzip_module.open(file_handle, 'rb') as gzip_fp:
                     return self._decode(gzip_fp, self.path)
 
+            if self.path.endswith(FileFormat.ZSTD.extension()):
+                zstandard = _import_zstandard()
+                with zstandard.ZstdDecompressor().stream_reader(file_handle, closefd=False) as zstd_fp:
+                    return self._decode(zstd_fp, self.path)
+
             return self._decode(file_handle, self.path)
 
-    def save(self, data, file_format, compress_level=0):
+    def save(self, data, file_format, compress_level=0, compress_format=FileFormat.GZIP):
         """ Method for saving a feature
         """
-        gz_extension = FileFormat.GZIP.extension() if compress_level else ''
-        path = self.path + file_format.extension() + gz_extension
+        compress_extension = compress_format.extension() if compress_level else ''
+        path = self.path + file_format.extension() + compress_extension
 
         if isinstance(self.filesystem, (fs.osfs.OSFS, TempFS)):
             with TempFS(temp_dir=self.filesystem.root_path) as tempfs:
-                self._save(tempfs, data, 'tmp_feature', file_format, compress_level)
+                self._save(tempfs, data, 'tmp_feature', file_format, compress_level, compress_format)
                 fs.move.move_file(tempfs, 'tmp_feature', self.filesystem, path)
             return
-        self._save(self.filesystem, data, path, file_format, compress_level)
+        self._save(self.filesystem, data, path, file_format, compress_level, compress_format)
 
-    def _save(self, filesystem, data, path, file_format, compress_level=0):
+    def _save(self, filesystem, data, path, file_format, compress_level=0, compress_format=FileFormat.GZIP):
         """ Given a filesystem it saves and compresses the data
         """
         with filesystem.openbin(path, 'w') as file_handle:
@@ -239,6 +281,13 @@ class FeatureIO:
                 self._write_to_file(data, file_handle, file_format)
                 return
 
+            if compress_format is FileFormat.ZSTD:
+                zstandard = _import_zstandard()
+                compressor = zstandard.ZstdCompressor(level=compress_level)
+                with compressor.stream_writer(file_handle, closefd=False) as zstd_file_handle:
+                    self._write_to_file(data, zstd_file_handle, file_format)
+                return
+
             with gzip.GzipFile(fileobj=file_handle, compresslevel=compress_level, mode='wb') as gzip_file_handle:
                 self._write_to_file(data, gzip_file_handle, file_format)
 
@@ -247,9 +296,9 @@ class FeatureIO:
         """ Writes to a file
         """
         if file_format is FileFormat.NPY:
-            np.save(file, data)
+            _write_npy(file, data)
         elif file_format is FileFormat.PICKLE:
-            pickle.dump(data, file)
+            pickle.dump(data, file, protocol=PICKLE_PROTOCOL)
 
     @staticmethod
     def _decode(file, path):
@@ -267,6 +316,36 @@ class FeatureIO:
             return data
 
         if FileFormat.NPY.extension() in path:
-            return np.load(file)
+            # Unlike np.load this doesn't seek backwards in the stream, which decompression streams don't support
+            return np.lib.format.read_array(file)
 
         raise ValueError('Unsupported data type.')
+
+
+def _write_npy(file, array):
+    """ Writes an array in NPY format. Unlike `np.save`, which copies data into temporary bytes objects chunk by chunk
+    unless it writes into a real file, this writes the data buffer of a C-contiguous array directly.
+    """
+    if array.dtype.hasobject or not array.flags.c_contiguous:
+        np.save(file, array)
+        return
+
+    header = np.lib.format.header_data_from_array_1_0(array)
+    try:
+        np.lib.format.write_array_header_1_0(file, header)
+    except ValueError:  # Header is too large for version 1.0 of the format
+        np.lib.format.write_array_header_2_0(file, header)
+
+    file.write(array.reshape(-1).view(np.uint8).data)
+
+
+def _import_zstandard():
+    """ Imports an optional dependency required for saving and loading zstd-compressed features
+    """
+    # pylint: disable=import-outside-toplevel,raise-missing-from
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError('Package zstandard has to be installed in order to save or load features compressed with '
+                          '{}'.format(FileFormat.ZSTD))
+    return zstandard
@@ -19,7 +19,7 @@ import numpy as np
 import geopandas as gpd
 from geopandas.testing import assert_geodataframe_equal
 
-from .constants import FeatureType
+from .constants import FeatureType, FEATURE_TYPE_VALUES
 
 LOGGER = logging.getLogger(__name__)
 
@@ -148,7 +148,7 @@ class FeatureParser:
             return FeatureParser._parse_tuple(features, new_names)
 
         if features is ...:
-            return OrderedDict([(feature_type, ...) for feature_type in FeatureType])
+            return OrderedDict.fromkeys(FEATURE_TYPE_VALUES.values(), ...)
 
         if isinstance(features, FeatureType):
             return OrderedDict([(features, ...)])
@@ -381,17 +381,15 @@ def deep_eq(fst_obj, snd_obj):
     :return: `True` if objects are deeply equal, `False` otherwise
     """
     # pylint: disable=too-many-return-statements
+    if isinstance(fst_obj, np.ndarray) and isinstance(snd_obj, np.ndarray):
+        if fst_obj.shape != snd_obj.shape or fst_obj.dtype != snd_obj.dtype:
+            return False
+        # Only floating, complex and datetime arrays can contain NaN values, which are considered equal to each other
+        return np.array_equal(fst_obj, snd_obj, equal_nan=fst_obj.dtype.kind in 'fcmM')
+
     if not isinstance(fst_obj, type(snd_obj)):
         return False
 
-    if isinstance(fst_obj, np.ndarray):
-        if fst_obj.dtype != snd_obj.dtype:
-            return False
-        fst_nan_mask = np.isnan(fst_obj)
-        snd_nan_mask = np.isnan(snd_obj)
-        return np.array_equal(fst_obj[~fst_nan_mask], snd_obj[~snd_nan_mask]) and \
-            np.array_equal(fst_nan_mask, snd_nan_mask)
-
     if isinstance(fst_obj, gpd.GeoDataFrame):
         try:
             assert_geodataframe_equal(fst_obj, snd_obj)
@@ -10,7 +10,9 @@ file in the root directory of this source tree.
 import unittest
 import logging
 import os
+import copy
 import datetime
+import warnings
 import numpy as np
 
 from geopandas import GeoSeries, GeoDataFrame
@@ -116,6 +118,16 @@ class TestEOPatchFeatureTypes(unittest.TestCase):
         with self.assertRaises(ValueError):
             eopatch.data_timeless['mask.npy'] = np.arange(3 * 3 * 2).reshape(3, 3, 2)
 
+        with self.assertRaises(ValueError):
+            EOPatch(meta_info={'info': 1, 'mask.npy': 2})
+
+    def test_init_feature_validation(self):
+        with self.assertRaises(ValueError):
+            EOPatch(data={'bands': np.zeros((2, 3, 3, 1)), 'mask': np.zeros((3, 3, 1))})
+
+        with self.assertRaises(ValueError):
+            EOPatch(mask_timeless={'mask': [[1]]})
+
 
 class TestEOPatch(unittest.TestCase):
 
@@ -270,6 +282,54 @@ class TestEOPatch(unittest.TestCase):
 
         self.assertNotEqual(eop1, eop2)
 
+    def test_copy_feature_dict(self):
+        eop = EOPatch(data={'bands': np.zeros((2, 3, 3, 2))})
+
+        data_copy = copy.copy(eop.data)
+        self.assertEqual(type(data_copy), type(eop.data))
+        self.assertEqual(data_copy.feature_type, FeatureType.DATA)
+        self.assertIs(data_copy['bands'], eop.data['bands'])
+
+        data_copy['new_bands'] = np.zeros((2, 3, 3, 1))
+        self.assertFalse('new_bands' in eop.data)
+
+        eop.mask = data_copy
+        self.assertEqual(eop.mask.feature_type, FeatureType.MASK)
+        self.assertIsNot(eop.mask, data_copy)
+
+    def test_deepcopy_shared_data(self):
+        data = np.arange(2 * 3 * 3 * 2).reshape(2, 3, 3, 2)
+        eop = EOPatch(data={'bands': data, 'same_bands': data})
+
+        eop_copy = copy.deepcopy(eop)
+        self.assertEqual(eop, eop_copy)
+        self.assertFalse(np.shares_memory(eop_copy.data['bands'], data))
+        self.assertIs(eop_copy.data['bands'], eop_copy.data['same_bands'])
+
+        eop_partial_copy = eop.__deepcopy__(features=[(FeatureType.DATA, 'bands')])
+        self.assertEqual(set(eop_partial_copy.data), {'bands'})
+        self.assertFalse(np.shares_memory(eop_partial_copy.data['bands'], data))
+
+    def test_time_series(self):
+        eop = EOPatch()
+        self.assertIsNone(eop.time_series())
+
+        eop.timestamp = ['2017-01-01T10:00:00', '2017-01-01T10:00:30', '2017-01-02T10:01:29.6']
+        self.assertTrue(np.array_equal(eop.time_series(), [0, 30, 86490]))
+        self.assertEqual(eop.time_series().dtype, np.int64)
+        self.assertTrue(np.array_equal(eop.time_series(scale_time=60), [0, 0, 1441]))
+
+        ref_date = datetime.datetime(2017, 1, 1)
+        self.assertTrue(np.array_equal(eop.time_series(ref_date=ref_date, scale_time=3600), [10, 10, 34]))
+
+        eop.timestamp = ['2017-01-01T10:00:00Z', '2017-01-01T10:00:30+00:00', '2017-01-01T12:01:00+02:00']
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            self.assertTrue(np.array_equal(eop.time_series(), [0, 30, 60]))
+
+            ref_date = datetime.datetime(2017, 1, 1, 11, tzinfo=datetime.timezone(datetime.timedelta(hours=2)))
+            self.assertTrue(np.array_equal(eop.time_series(ref_date=ref_date, scale_time=60), [60, 60, 61]))
+
     def test_timestamp_consolidation(self):
         # 10 frames
         timestamps = [datetime.datetime(2017, 1, 1, 10, 4, 7),
@@ -310,6 +370,23 @@ class TestEOPatch(unittest.TestCase):
         self.assertTrue(np.array_equal(scalar[1:-1, ...], eop.scalar['SCALAR']))
         self.assertTrue(np.array_equal(mask_timeless, eop.mask_timeless['MASK_TIMELESS']))
 
+        consolidated_data = eop.data['DATA']
+        removed_frames = eop.consolidate_timestamps(timestamps)
+        self.assertEqual(removed_frames, set())
+        self.assertEqual(good_timestamps[:-1], eop.timestamp)
+        self.assertIs(eop.data['DATA'], consolidated_data)
+
+        # All occurrences of a removed date are removed
+        duplicated_timestamps = timestamps[:3] + timestamps[1:2]
+        eop = EOPatch(timestamp=duplicated_timestamps, data={'DATA': data[:4]}, scalar={'SCALAR': scalar[:4]})
+
+        removed_frames = eop.consolidate_timestamps([timestamps[0], timestamps[2]])
+
+        self.assertEqual(removed_frames, {timestamps[1]})
+        self.assertEqual(eop.timestamp, [timestamps[0], timestamps[2]])
+        self.assertTrue(np.array_equal(data[[0, 2], ...], eop.data['DATA']))
+        self.assertTrue(np.array_equal(scalar[[0, 2], ...], eop.scalar['SCALAR']))
+
 
 if __name__ == '__main__':
     unittest.main()
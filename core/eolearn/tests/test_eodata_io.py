@@ -11,6 +11,7 @@ import logging
 import datetime
 import os
 import tempfile
+from unittest import mock
 
 import numpy as np
 import fs
@@ -22,7 +23,8 @@ from moto import mock_s3
 import boto3
 
 from sentinelhub import BBox, CRS
-from eolearn.core import EOPatch, FeatureType, OverwritePermission, SaveTask, LoadTask
+from eolearn.core import EOPatch, FeatureType, FileFormat, OverwritePermission, SaveTask, LoadTask
+from eolearn.core.eodata_io import igzip
 
 logging.basicConfig(level=logging.INFO)
 
@@ -146,6 +148,49 @@ class TestEOPatchIO(unittest.TestCase):
                 eopatch3 = EOPatch.load('/', filesystem=temp_fs, lazy_loading=True, features=features)
                 self.assertNotEqual(self.eopatch, eopatch3)
 
+    def test_load_mmap(self):
+        with TempFS() as temp_fs:
+            self.eopatch.save('/', filesystem=temp_fs)
+            # Only a compressed version of the feature is kept, otherwise it would depend on listing order of files
+            # which one gets loaded
+            temp_fs.remove('/data_timeless/mask.npy')
+            self.eopatch.save('/', filesystem=temp_fs, features=[(FeatureType.DATA_TIMELESS, 'mask')],
+                              compress_level=1)
+            self.assertEqual(temp_fs.listdir('/data_timeless'), ['mask.npy.gz'])
+
+            for lazy_loading in [True, False]:
+                eopatch = EOPatch.load(temp_fs.root_path, lazy_loading=lazy_loading, mmap=True)
+                self.assertEqual(self.eopatch, eopatch)
+                self.assertTrue(isinstance(eopatch.data['data'], np.memmap))
+                self.assertFalse(eopatch.data['data'].flags.writeable)
+                self.assertFalse(isinstance(eopatch.data_timeless['mask'], np.memmap))
+
+    def test_save_load_zstd_compression(self):
+        for fs_loader in self.filesystem_loaders:
+            with fs_loader() as temp_fs:
+                self.eopatch.save('/', filesystem=temp_fs, compress_level=3, compress_format=FileFormat.ZSTD)
+                self.assertTrue(temp_fs.exists('/data/data.npy.zst'))
+                self.assertTrue(temp_fs.exists('/bbox.pkl.zst'))
+
+                for lazy_loading in [True, False]:
+                    eopatch = EOPatch.load('/', filesystem=temp_fs, lazy_loading=lazy_loading)
+                    self.assertEqual(self.eopatch, eopatch)
+
+                with self.assertRaises(ValueError):
+                    self.eopatch.save('/', filesystem=temp_fs, compress_level=3, compress_format=FileFormat.NPY,
+                                      overwrite_permission=OverwritePermission.OVERWRITE_PATCH)
+
+    @unittest.skipIf(igzip is None, 'isal is not installed')
+    def test_load_gzip_with_igzip(self):
+        for fs_loader, uses_igzip in zip(self.filesystem_loaders, [True, False]):
+            with fs_loader() as temp_fs, mock.patch.object(igzip, 'open', wraps=igzip.open) as igzip_open:
+                self.eopatch.save('/', filesystem=temp_fs, compress_level=1)
+                self.assertTrue(temp_fs.exists('/data/data.npy.gz'))
+
+                eopatch = EOPatch.load('/', filesystem=temp_fs, lazy_loading=False)
+                self.assertEqual(self.eopatch, eopatch)
+                self.assertEqual(igzip_open.called, uses_igzip)
+
     def test_save_add_only_features(self):
         features = [
             (FeatureType.DATA_TIMELESS, 'mask'),
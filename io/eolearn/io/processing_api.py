@@ -3,7 +3,6 @@
 import collections
 import logging
 import datetime as dt
-from itertools import repeat
 
 import numpy as np
 from sentinelhub import SentinelHubRequest, WebFeatureService, MimeType, SentinelHubDownloadClient, SHConfig, \
@@ -41,7 +40,7 @@ def get_available_timestamps(bbox, config, data_collection, maxcc, time_differen
         raise ValueError("No available images for requested time range: {}".format(time_interval))
 
     dates = sorted(dates)
-    return [dates[0]] + [d2 for d1, d2 in zip(dates[:-1], dates[1:]) if d2 - d1 > time_difference]
+    return [dates[0]] + [d2 for d1, d2 in zip(dates, dates[1:]) if d2 - d1 > time_difference]
 
 
 class SentinelHubInputBase(EOTask):
@@ -138,13 +137,8 @@ class SentinelHubInputBase(EOTask):
     def check_timestamp_difference(timestamp1, timestamp2):
         """ Raises an error if the two timestamps are not the same
         """
-        error_msg = "Trying to write data to an existing eopatch with a different timestamp."
-        if len(timestamp1) != len(timestamp2):
-            raise ValueError(error_msg)
-
-        for ts1, ts2 in zip(timestamp1, timestamp2):
-            if ts1 != ts2:
-                raise ValueError(error_msg)
+        if list(timestamp1) != list(timestamp2):
+            raise ValueError("Trying to write data to an existing eopatch with a different timestamp.")
 
     def _extract_data(self, eopatch, images, shape):
         """ Extract data from the received images and assign them to eopatch features
@@ -192,6 +186,8 @@ class SentinelHubInputTask(SentinelHubInputBase):
 
     CUSTOM_BAND_TYPE = ProcApiType("custom", 'REFLECTANCE', 'FLOAT32', np.float32, FeatureType.DATA)
 
+    _BAND_TO_TYPE = {band: btype for btype, bands in PREDEFINED_BAND_TYPES.items() for band in bands}
+
     def __init__(self, data_collection=None, size=None, resolution=None, bands_feature=None, bands=None,
                  additional_data=None, evalscript=None, maxcc=1.0, time_difference=None, cache_folder=None,
                  max_threads=None, config=None, bands_dtype=np.float32, single_scene=False,
@@ -223,7 +219,9 @@ class SentinelHubInputTask(SentinelHubInputBase):
         :type config: SHConfig or None
         :param max_threads: Maximum threads to be used when downloading data.
         :type max_threads: int
-        :param bands_dtype: dtype of the bands array
+        :param bands_dtype: dtype of the bands array. Only `numpy.float32` bands are normalized. For integer dtypes
+            the original digital numbers are kept and normalization factors are stored in a separate
+            `(FeatureType.SCALAR, 'NORM_FACTORS')` feature.
         :type bands_dtype: type
         :param single_scene: If true, the service will compute a single image for the given time interval using
             mosaicking.
@@ -264,16 +262,9 @@ class SentinelHubInputTask(SentinelHubInputBase):
 
     @staticmethod
     def _add_request_bands(request_dict, added_bands):
-        predefined_types = SentinelHubInputTask.PREDEFINED_BAND_TYPES.items()
-
         for band in added_bands:
-            found = next(((btype, band) for btype, bands in predefined_types if band in bands), None)
-            api_type, band = found or (SentinelHubInputTask.CUSTOM_BAND_TYPE, band)
-
-            if api_type not in request_dict:
-                request_dict[api_type] = []
-
-            request_dict[api_type].append(band)
+            api_type = SentinelHubInputTask._BAND_TO_TYPE.get(band, SentinelHubInputTask.CUSTOM_BAND_TYPE)
+            request_dict.setdefault(api_type, []).append(band)
 
     def generate_evalscript(self):
         """ Generate the evalscript to be passed with the request, based on chosen bands
@@ -323,10 +314,8 @@ class SentinelHubInputTask(SentinelHubInputBase):
             samples = ', '.join('{band_id}: {bands}'.format(band_id=band_id, bands=bands) for band_id, bands in samples)
             samples = '{{{samples}}};'.format(samples=samples)
 
-        bands = ["\"{}\"".format(band) for bands in self.requested_bands.values() for band in bands]
-
-        units = (unit.unit for btype, bands in self.requested_bands.items() for unit, band in zip(repeat(btype), bands))
-        units = ["\"{}\"".format(unit) for unit in units]
+        bands = [f'"{band}"' for bands in self.requested_bands.values() for band in bands]
+        units = [f'"{btype.unit}"' for btype, bands in self.requested_bands.items() for _ in bands]
 
         evalscript = evalscript.format(
             bands=', '.join(bands), units=', '.join(units), outputs=', '.join(outputs), samples=samples
@@ -351,16 +340,19 @@ class SentinelHubInputTask(SentinelHubInputBase):
         else:
             dates = [(date - self.time_difference, date + self.time_difference) for date in timestamp]
 
-        return [self._create_sh_request(date1, date2, bbox, size_x, size_y) for date1, date2 in dates]
-
-    def _create_sh_request(self, date_from, date_to, bbox, size_x, size_y):
-        """ Create an instance of SentinelHubRequest
-        """
+        # Parts of requests that don't depend on a timestamp are created only once and shared by all requests
+        evalscript = self.evalscript or self.generate_evalscript()
         responses = [SentinelHubRequest.output_response(btype.id, MimeType.TIFF) for btype in self.requested_bands]
         responses.append(SentinelHubRequest.output_response('userdata', MimeType.JSON))
 
+        return [self._create_sh_request(date1, date2, bbox, size_x, size_y, evalscript, responses)
+                for date1, date2 in dates]
+
+    def _create_sh_request(self, date_from, date_to, bbox, size_x, size_y, evalscript, responses):
+        """ Create an instance of SentinelHubRequest
+        """
         return SentinelHubRequest(
-            evalscript=self.evalscript or self.generate_evalscript(),
+            evalscript=evalscript,
             input_data=[
                 SentinelHubRequest.input_data(
                     data_collection=self.data_collection,
@@ -393,38 +385,60 @@ class SentinelHubInputTask(SentinelHubInputBase):
         """
         feature = {band: (ftype, new_name) for ftype, band, new_name in self.additional_data}
         for btype, tifs, bands in self._iter_tifs(images, ['bool_mask', 'mask', 'uint8_data', 'other']):
-            for band in bands:
-                eopatch[feature[band]] = self._extract_array(tifs, bands.index(band), shape, btype.np_dtype)
+            for idx, band in enumerate(bands):
+                eopatch[feature[band]] = self._extract_array(tifs, idx, shape, btype.np_dtype)
 
     def _extract_bands_feature(self, eopatch, images, shape):
-        """ Extract the bands feature arrays and concatenate them along the last axis
+        """ Extract the bands feature array by writing bands of all requested types into a single preallocated array
         """
-        tifs = self._iter_tifs(images, ['bands', 'custom'])
+        tifs = list(self._iter_tifs(images, ['bands', 'custom']))
         norms = [(img.get('userdata.json') or {}).get('norm_factor', 1) for img in images]
 
-        itr = [(btype, images, bands, bands.index(band)) for btype, images, bands in tifs for band in bands]
-        bands = [self._extract_array(images, idx, shape, self.bands_dtype, norms) for btype, images, band, idx in itr]
+        # The final array is allocated only once and all bands of the same type are written into it at once
+        num_bands = sum(len(band_names) for _, _, band_names in tifs)
+        bands = np.empty((*shape, num_bands), dtype=self.bands_dtype)
 
-        if self.bands_dtype == np.uint16:
+        start_idx = 0
+        for _, band_tifs, band_names in tifs:
+            end_idx = start_idx + len(band_names)
+            self._fill_array(bands[..., start_idx:end_idx], band_tifs, slice(len(band_names)), norms)
+            start_idx = end_idx
+
+        # Integer bands are not normalized, therefore normalization factors are stored separately
+        if np.issubdtype(self.bands_dtype, np.integer):
             norms = np.asarray(norms).reshape(shape[0], 1).astype(np.float32)
             eopatch[(FeatureType.SCALAR, 'NORM_FACTORS')] = norms
 
-        eopatch[self.bands_feature] = np.concatenate(bands, axis=-1)
+        eopatch[self.bands_feature] = bands
 
     def _iter_tifs(self, tars, band_types):
-        rtypes = (btype for btype in self.requested_bands if btype.id in band_types)
-        return ((btype, [tar[btype.id + '.tif'] for tar in tars], self.requested_bands[btype]) for btype in rtypes)
+        for btype, bands in self.requested_bands.items():
+            if btype.id in band_types:
+                tif_name = btype.id + '.tif'
+                yield btype, [tar[tif_name] for tar in tars], bands
 
     @staticmethod
     def _extract_array(tifs, idx, shape, dtype, norms=None):
         """ Extract a numpy array from the received tifs and normalize it if normalization factors are provided
         """
+        feature_array = np.empty((*shape, 1), dtype=dtype)
+        SentinelHubInputTask._fill_array(feature_array, tifs, slice(idx, idx + 1), norms)
+        return feature_array
+
+    @staticmethod
+    def _fill_array(array, tifs, band_slice, norms=None):
+        """ Writes bands from the received tifs into an array of shape (time, height, width, bands). Bands are
+        normalized if normalization factors are provided and the array is of type float32.
+        """
+        normalize = norms and array.dtype == np.float32
 
-        feature_arrays = (np.atleast_3d(img)[..., idx] for img in tifs)
-        if norms and dtype == np.float32:
-            feature_arrays = (np.round(array * norm, 4) for array, norm in zip(feature_arrays, norms))
+        for time_idx, img in enumerate(tifs):
+            feature_array = (img if img.ndim == 3 else np.atleast_3d(img))[..., band_slice]
+            if normalize:
+                feature_array = feature_array * norms[time_idx]
+                np.round(feature_array, 4, out=feature_array)
 
-        return np.asarray(list(feature_arrays), dtype=dtype).reshape(*shape, 1)
+            array[time_idx] = feature_array
 
     def _add_meta_info(self, eopatch):
         """ Add any additional meta data to the eopatch
@@ -268,6 +268,83 @@ class TestProcessingIO(unittest.TestCase):
         self.assertTrue(array.shape == (20, height, width, 3))
 
 
+class TestProcessingIOExtraction(unittest.TestCase):
+    """ Test cases for extracting features from responses of Processing API, which don't require downloading data
+    """
+    shape = 3, 4, 5
+
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(42)
+        time, height, width = cls.shape
+
+        cls.images = [{
+            'bands.tif': rng.integers(0, 10000, size=(height, width, 2), dtype=np.uint16),
+            'custom.tif': rng.uniform(0, 1000, size=(height, width)).astype(np.float32),
+            'bool_mask.tif': rng.integers(0, 2, size=(height, width), dtype=np.uint8),
+            'mask.tif': rng.integers(0, 10, size=(height, width, 2), dtype=np.uint8),
+            'userdata.json': {'norm_factor': 0.0001 * (idx + 1)}
+        } for idx in range(time)]
+
+        cls.raw_bands = np.stack([
+            np.concatenate([img['bands.tif'], img['custom.tif'][..., np.newaxis]], axis=-1) for img in cls.images
+        ])
+        cls.normalized_bands = np.stack([
+            np.concatenate([
+                np.round(img['bands.tif'] * img['userdata.json']['norm_factor'], 4),
+                np.round(img['custom.tif'][..., np.newaxis] * img['userdata.json']['norm_factor'], 4)
+            ], axis=-1) for img in cls.images
+        ]).astype(np.float32)
+        cls.norms = np.array([img['userdata.json']['norm_factor'] for img in cls.images])
+
+    def _extract(self, bands_dtype):
+        task = SentinelHubInputTask(
+            bands_feature=(FeatureType.DATA, 'BANDS'),
+            bands=['B02', 'B03', 'CUSTOM_BAND'],
+            additional_data=[(FeatureType.MASK, 'dataMask', 'IS_DATA'), (FeatureType.MASK, 'CLM'),
+                             (FeatureType.MASK, 'SCL')],
+            size=self.shape[:0:-1],
+            data_collection=DataCollection.SENTINEL2_L1C,
+            bands_dtype=bands_dtype
+        )
+        return task._extract_data(EOPatch(), self.images, self.shape)
+
+    def test_float32_bands(self):
+        eopatch = self._extract(np.float32)
+        bands = eopatch[(FeatureType.DATA, 'BANDS')]
+
+        self.assertEqual(bands.dtype, np.float32)
+        self.assertEqual(bands.shape, (*self.shape, 3))
+        self.assertTrue(np.array_equal(bands, self.normalized_bands))
+        self.assertNotIn('NORM_FACTORS', eopatch.scalar)
+
+    def test_integer_bands(self):
+        for bands_dtype in [np.uint16, np.int16]:
+            with self.subTest(bands_dtype=bands_dtype):
+                eopatch = self._extract(bands_dtype)
+                bands = eopatch[(FeatureType.DATA, 'BANDS')]
+
+                self.assertEqual(bands.dtype, bands_dtype)
+                self.assertTrue(np.array_equal(bands, self.raw_bands.astype(bands_dtype)))
+
+                norm_factors = eopatch[(FeatureType.SCALAR, 'NORM_FACTORS')]
+                self.assertEqual(norm_factors.dtype, np.float32)
+                self.assertTrue(np.array_equal(norm_factors, self.norms.reshape(-1, 1).astype(np.float32)))
+
+    def test_additional_data(self):
+        eopatch = self._extract(np.float32)
+
+        is_data = eopatch[(FeatureType.MASK, 'IS_DATA')]
+        self.assertEqual(is_data.dtype, bool)
+        self.assertTrue(np.array_equal(is_data[..., 0], np.stack([img['bool_mask.tif'] for img in self.images])))
+
+        for idx, band in enumerate(['CLM', 'SCL']):
+            mask = eopatch[(FeatureType.MASK, band)]
+            self.assertEqual(mask.dtype, np.uint8)
+            self.assertEqual(mask.shape, (*self.shape, 1))
+            self.assertTrue(np.array_equal(mask[..., 0], np.stack([img['mask.tif'][..., idx] for img in self.images])))
+
+
 class TestSentinelHubInputTaskDataCollections(unittest.TestCase):
     """ Integration tests for all supported data collections
     """